@@ -1,6 +1,7 @@
-import os, re, json, yaml, requests, markdown
+import os, re, sys, json, time, shutil, pickle, hashlib, threading, yaml, requests, markdown
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
 
 # ==================== 路径配置 ====================
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -11,6 +12,17 @@ ARTICLE_DIR = os.path.join(DOCS_DIR, "article")
 OMD_DIR = os.path.join(BASE_DIR, "O-MD")
 OMD_JSON = os.path.join(OMD_DIR, "articles.json")
 BASE_YAML_OUT = os.path.join(BASE_DIR, "base.yaml")
+BASE_JSON_OUT = os.path.join(BASE_DIR, "base.json")
+MD_CACHE_DIR = os.path.join(BASE_DIR, ".valog-cache", "md")
+ISSUES_CACHE = os.path.join(BASE_DIR, ".valog-cache", "issues.json")
+CONFIG_CACHE = os.path.join(BASE_DIR, ".valog-cache", "config.pkl")
+INDEX_HASH_CACHE = os.path.join(BASE_DIR, ".valog-cache", "index.hash")
+JINJA_CACHE_DIR = os.path.join(BASE_DIR, ".valog-cache", "jinja")
+
+# 每篇文章都要拼的两个输出路径：目录前缀提前拼好，
+# 循环里只剩一次f-string拼接，不再走os.path.join的逐参数归一化
+ARTICLE_PATH_PREFIX = os.path.join(ARTICLE_DIR, "")
+OMD_PATH_PREFIX = os.path.join(OMD_DIR, "")
 
 # 默认模板文件名
 DEFAULT_ARTICLE_TEMPLATE = "article.html"
@@ -19,6 +31,80 @@ DEFAULT_HOME_TEMPLATE = "home.html"
 # 创建必要的目录
 os.makedirs(ARTICLE_DIR, exist_ok=True)
 os.makedirs(OMD_DIR, exist_ok=True)
+os.makedirs(MD_CACHE_DIR, exist_ok=True)
+os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+
+# 预编译的正则：放在模块级避免热路径上反复走re模块的模式缓存
+_CODE_CLASS_RE = re.compile(r'<pre><code(?!\s*class=)')
+
+def _span_text(line):
+    """取行内第一个<span ...>...</span>的内容；格式不符返回None
+
+    元数据行的结构是固定的，三次str.find就够了，不必动用正则引擎
+    """
+    i = line.find('<span')
+    if i == -1:
+        return None
+    j = line.find('>', i + 5)
+    if j == -1:
+        return None
+    k = line.find('</span>', j + 1)
+    if k == -1:
+        return None
+    return line[j + 1:k]
+
+# YAML读写：优先libyaml的C实现（快5~10倍），未编译进PyYAML时回退纯Python
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# JSON序列化：优先orjson（C实现，比标准库快3~10倍，直接产出UTF-8），
+# 未安装时回退到标准库的紧凑模式
+try:
+    import orjson
+
+    # OPT_NON_STR_KEYS：配置里的映射key可能被YAML解析成int/date等，
+    # 标准库会静默转成字符串，orjson默认直接抛TypeError——对齐两者行为
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    def _dumps_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+except ImportError:
+    orjson = None
+
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+    def _dumps_pretty(obj):
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+
+def _write_bytes(path, data):
+    """用一对os.open/os.close加单次os.write直写字节，跳过Python缓冲IO层；
+    先写同目录临时文件再os.replace原子替换，构建中断不会留下半截文件"""
+    tmp = path + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+def _link_or_copy(src, dst):
+    """优先硬链接，失败时退回普通拷贝；未变化的文件共享inode，不重写任何字节"""
+    try:
+        if os.path.exists(dst):
+            if os.path.samefile(src, dst):
+                return dst  # 已经是同一个inode，无需操作
+            st_src, st_dst = os.stat(src), os.stat(dst)
+            if st_src.st_size == st_dst.st_size and st_src.st_mtime == st_dst.st_mtime:
+                return dst  # 大小和mtime都一致，视为未变化（copy2会保留mtime）
+            os.remove(dst)
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
 
 class VaLogGenerator:
     def __init__(self):
@@ -29,13 +115,7 @@ class VaLogGenerator:
             print(f"警告: 配置文件不存在: {CONFIG_PATH}")
             self.config = {}
         else:
-            try:
-                with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-                    self.config = yaml.safe_load(f) or {}
-                print(f"配置文件加载成功: {CONFIG_PATH}")
-            except Exception as e:
-                print(f"配置文件加载失败: {e}")
-                self.config = {}
+            self.config = self._load_config()
         
         # 从配置中读取模板文件名，如果没有配置则使用默认值
         self.article_template_name = self.config.get('templates', {}).get('VaLog-default-article', DEFAULT_ARTICLE_TEMPLATE)
@@ -43,7 +123,62 @@ class VaLogGenerator:
         
         print(f"文章模板: {self.article_template_name}")
         print(f"首页模板: {self.home_template_name}")
+
+        # Markdown引擎：默认python-markdown；可配置 markdown_engine 为
+        # "cmark"（C实现的cmarkgfm）或 "mistune"（纯Python但快5~10倍），
+        # 未安装时自动回退
+        self._cmark = None
+        self._mistune = None
+        engine_version = ""
+        engine = self.config.get('markdown_engine')
+        if engine == 'cmark':
+            try:
+                import cmarkgfm
+                self._cmark = cmarkgfm
+                engine_version = getattr(cmarkgfm, '__version__', 'unknown')
+                print("Markdown引擎: cmarkgfm")
+            except ImportError:
+                print("cmarkgfm未安装，回退到python-markdown")
+        elif engine == 'mistune':
+            try:
+                import mistune
+                self._mistune = mistune.create_markdown(
+                    escape=False,
+                    hard_wrap=True,  # 对应nl2br的换行行为
+                    plugins=['table', 'strikethrough', 'footnotes'],
+                )
+                engine_version = getattr(mistune, '__version__', 'unknown')
+                print("Markdown引擎: mistune")
+            except ImportError:
+                print("mistune未安装，回退到python-markdown")
+
+        # 解析器按线程构建一次：扩展注册/正则编译是按实例的固定开销，
+        # 每篇文章调用 reset().convert() 复用实例；python-markdown实例
+        # 带有解析状态，不能跨线程共享，因此放在threading.local里
+        self._md_local = threading.local()
+
+        # 进程内memo：同一次构建里重复的正文只转换一次（上限防止内存失控）
+        self._md_memo = {}
+
+        # Markdown磁盘缓存的key前缀：引擎/扩展/库版本变化时自动失效
+        if self._cmark is not None:
+            self._md_cache_tag = f"cmark-{engine_version}"
+        elif self._mistune is not None:
+            self._md_cache_tag = f"mistune-{engine_version}-table,strikethrough,footnotes"
+        else:
+            self._md_cache_tag = f"python-markdown-{markdown.__version__}-extra,fenced_code,tables,nl2br,sane_lists"
         
+        # GitHub仓库信息只在这里解析一次，各处直接复用
+        self.repo = os.getenv("REPO")
+        self.token = os.getenv("GITHUB_TOKEN")
+        parts = self.repo.split('/', 1) if self.repo else []
+        if len(parts) == 2 and parts[0] and parts[1]:
+            self.owner, self.repo_name = parts
+            self.blog_url = f"https://{self.owner}.github.io/{self.repo_name}/"
+        else:
+            self.owner = self.repo_name = ""
+            self.blog_url = None
+
         # 加载缓存
         self.cache = {}
         if os.path.exists(OMD_JSON):
@@ -56,6 +191,54 @@ class VaLogGenerator:
                 self.cache = {}
         else:
             print("无缓存文件，将创建新缓存")
+
+        # 上次请求的ETag与文章条目分开存放（"_etag"是保留key，不会与issue编号冲突）
+        self._etag = self.cache.pop("_etag", None)
+        # 上次构建使用的文章模板哈希（保留key同上）
+        self._prev_template_sha = self.cache.pop("_template_sha", None)
+
+        # 复用同一个HTTP会话：翻页时共享TCP/TLS连接，省掉重复握手；
+        # 装有httpx(+h2)时改用HTTP/2客户端，多页请求复用同一条连接
+        self.session = None
+        self._status_retry = False
+        self._http_errors = (requests.exceptions.RequestException,)
+        try:
+            import httpx
+            # transport层重试覆盖连接级瞬时故障；429/5xx的状态码重试
+            # 由_http_get补上（requests路径交给适配器的Retry，见下）
+            self.session = httpx.Client(
+                transport=httpx.HTTPTransport(retries=3, http2=True),
+                timeout=30,
+            )
+            self._status_retry = True
+            self._http_errors = (httpx.HTTPError, requests.exceptions.RequestException)
+            print("HTTP客户端: httpx (HTTP/2)")
+        except Exception:
+            pass
+        if self.session is None:
+            self.session = requests.Session()
+            # 调大连接池以配合并行翻页，并对瞬时故障/二级限流做带退避的重试
+            try:
+                from requests.adapters import HTTPAdapter, Retry
+                adapter = HTTPAdapter(
+                    pool_connections=10,
+                    pool_maxsize=10,
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=1,
+                        status_forcelist=[429, 500, 502, 503, 504],
+                        allowed_methods=frozenset(['GET']),
+                        respect_retry_after_header=True,
+                    ),
+                )
+                self.session.mount("https://", adapter)
+            except Exception as e:
+                print(f"HTTP适配器配置失败（使用默认连接池）: {e}")
+
+        # 写盘统计（_write_if_changed在线程池里也会被调用，用锁保护计数）
+        self._files_written = 0
+        self._files_skipped = 0
+        self._io_lock = threading.Lock()
         
         # 创建模板环境
         if not os.path.exists(TEMPLATE_DIR):
@@ -67,10 +250,111 @@ class VaLogGenerator:
             loader=FileSystemLoader(TEMPLATE_DIR),
             autoescape=False,
             trim_blocks=True,
-            lstrip_blocks=True
+            lstrip_blocks=True,
+            auto_reload=False,  # 构建期间模板不会变，省掉每次get_template的mtime检查
+            cache_size=-1,      # 编译结果全部常驻
+            # 编译产物落盘：跨进程复用，下次运行跳过Jinja的词法/编译阶段
+            bytecode_cache=FileSystemBytecodeCache(JINJA_CACHE_DIR),
         )
         print("Jinja2环境初始化完成")
 
+        # 模板只加载/编译一次，文章渲染与首页生成直接复用编译结果
+        try:
+            self.article_tmpl = self.env.get_template(self.article_template_name)
+        except Exception as e:
+            print(f"文章模板加载失败: {e}")
+            self.article_tmpl = None
+        try:
+            self.home_tmpl = self.env.get_template(self.home_template_name)
+        except Exception as e:
+            print(f"首页模板加载失败: {e}")
+            self.home_tmpl = None
+
+        # 文章模板源码的哈希：模板变化时增量缓存整体失效，全部重渲
+        try:
+            with open(os.path.join(TEMPLATE_DIR, self.article_template_name), 'rb') as f:
+                self._template_sha = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            self._template_sha = ""
+        self._template_changed = self._prev_template_sha != self._template_sha
+        if self._template_changed and self._prev_template_sha is not None:
+            print("文章模板已变化，所有页面将重新渲染")
+
+        # 首页模板哈希：供generate_index的输入指纹使用
+        try:
+            with open(os.path.join(TEMPLATE_DIR, self.home_template_name), 'rb') as f:
+                self._home_template_sha = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            self._home_template_sha = ""
+
+    def _load_config(self):
+        """加载config.yml，带mtime校验的pickle旁路缓存
+
+        YAML解析远慢于pickle反序列化；配置文件很少变化，缓存命中时
+        完全绕开yaml。缓存损坏或版本不兼容时静默回退到正常解析。
+        """
+        mtime = os.path.getmtime(CONFIG_PATH)
+        try:
+            with open(CONFIG_CACHE, 'rb') as f:
+                cached_mtime, cfg = pickle.load(f)
+            if cached_mtime == mtime:
+                print(f"配置文件加载成功（缓存）: {CONFIG_PATH}")
+                return cfg
+        except Exception:
+            pass
+        try:
+            with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
+                cfg = yaml.load(f, Loader=_YamlLoader) or {}
+            print(f"配置文件加载成功: {CONFIG_PATH}")
+        except Exception as e:
+            print(f"配置文件加载失败: {e}")
+            return {}
+        try:
+            with open(CONFIG_CACHE, 'wb') as f:
+                pickle.dump((mtime, cfg), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            pass  # 缓存写失败不影响本次构建
+        return cfg
+
+    def _write_if_changed(self, path, data):
+        """内容逐字节相同则跳过写盘，返回是否真正写入
+
+        避免无意义的磁盘写入和mtime变化，git diff/rsync/CI缓存都只看到
+        真正变化的文件。
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        try:
+            if os.path.getsize(path) == len(data):
+                with open(path, "rb") as f:
+                    if f.read() == data:
+                        with self._io_lock:
+                            self._files_skipped += 1
+                        return False
+        except OSError:
+            pass
+        _write_bytes(path, data)
+        with self._io_lock:
+            self._files_written += 1
+        return True
+
+    def _get_md(self):
+        """取当前线程的python-markdown解析器，第一次使用时构建"""
+        md = getattr(self._md_local, "md", None)
+        if md is None:
+            md = markdown.Markdown(
+                extensions=[
+                    'extra',          # 包括表格、脚注等
+                    'fenced_code',    # 代码块
+                    'tables',         # 表格支持
+                    'nl2br',          # 自动将换行转换为 <br>
+                    'sane_lists',     # 更智能的列表处理
+                ],
+                output_format='html5'
+            )
+            self._md_local.md = md
+        return md
+
     def extract_metadata_and_body(self, body):
         """准确提取元数据并在渲染前将其从正文中彻底移除"""
         if not body:
@@ -80,37 +364,47 @@ class VaLogGenerator:
                 "body": ""
             }
             
-        lines = body.split('\n')
+        # 只定位前两行的边界，正文主体始终保持整串，不再做任何切分
+        nl1 = body.find('\n')
+        line1 = body if nl1 == -1 else body[:nl1]
+        if nl1 == -1:
+            line2, nl2 = None, -1
+        else:
+            nl2 = body.find('\n', nl1 + 1)
+            line2 = body[nl1 + 1:] if nl2 == -1 else body[nl1 + 1:nl2]
+
         summary = ["暂无简介"]
         vertical_title = ""
-        
-        # 定义需要跳过的行索引
-        meta_indices = []
-        
+        matched1 = matched2 = False
+
         # 1. 检查第一行是否为摘要元数据
-        if len(lines) > 0 and lines[0].strip().startswith('!vml-'):
-            match = re.search(r'<span[^>]*>(.*?)</span>', lines[0])
-            if match:
-                summary = [match.group(1).strip()]
-                meta_indices.append(0) # 记录该行需要被移除
-        
+        if line1.strip().startswith('!vml-'):
+            text = _span_text(line1)
+            if text is not None:
+                summary = [text.strip()]
+                matched1 = True
+
         # 2. 检查第二行是否为垂直标题元数据
-        if len(lines) > 1 and lines[1].strip().startswith('!vml-'):
-            match = re.search(r'<span[^>]*>(.*?)</span>', lines[1])
-            if match:
-                vertical_title = match.group(1).strip()
-                meta_indices.append(1) # 记录该行需要被移除
-        
-        # 3. 过滤正文：只排除那些被确认为元数据的行
-        content_lines = [
-            line for i, line in enumerate(lines) 
-            if i not in meta_indices
-        ]
-        
+        if line2 is not None and line2.strip().startswith('!vml-'):
+            text = _span_text(line2)
+            if text is not None:
+                vertical_title = text.strip()
+                matched2 = True
+
+        # 3. 按命中的行用偏移量切出剩余正文（无元数据时直接复用原串）
+        if matched1 and matched2:
+            content = body[nl2 + 1:] if nl2 != -1 else ""
+        elif matched1:
+            content = body[nl1 + 1:] if nl1 != -1 else ""
+        elif matched2:
+            content = line1 if nl2 == -1 else line1 + "\n" + body[nl2 + 1:]
+        else:
+            content = body
+
         return {
             "summary": summary,
             "vertical_title": vertical_title,
-            "body": "\n".join(content_lines).strip()
+            "body": content.strip()
         }
 
     def process_body(self, body):
@@ -122,26 +416,47 @@ class VaLogGenerator:
         print(f"处理正文，原始长度: {len(body)} 字符")
         if len(body) > 0:
             print(f"前200字符预览: {repr(body[:200])}")
-        
+
+        # 磁盘缓存：同样的正文+同样的引擎配置 => 直接复用上次的转换结果，
+        # 增量构建时省掉整个Markdown解析
+        cache_key = hashlib.sha256(
+            (self._md_cache_tag + "\x00" + body).encode("utf-8")
+        ).hexdigest()
+        # 进程内memo：同一次构建里重复出现的正文直接复用（dict读写有GIL保护）
+        memo_hit = self._md_memo.get(cache_key)
+        if memo_hit is not None:
+            return memo_hit
+
+        # 按前两位哈希分桶，避免单目录里文件过多拖慢查找
+        cache_path = os.path.join(MD_CACHE_DIR, cache_key[:2], cache_key[2:] + ".html")
+        # EAFP：直接尝试打开，省掉命中路径上的一次stat系统调用
         try:
-            # 使用 nl2br 扩展来自动处理换行
-            html_content = markdown.markdown(
-                body, 
-                extensions=[
-                    'extra',          # 包括表格、脚注等
-                    'fenced_code',    # 代码块
-                    'tables',         # 表格支持
-                    'nl2br',          # 自动将换行转换为 <br>
-                    'sane_lists',     # 更智能的列表处理
-                ],
-                output_format='html5'
-            )
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = f.read()
+            print(f"Markdown缓存命中: {cache_key[:12]}")
+            if len(self._md_memo) < 4096:
+                self._md_memo[cache_key] = cached
+            return cached
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Markdown缓存读取失败: {e}")
+
+        try:
+            if self._cmark is not None:
+                # cmarkgfm自带表格/代码块支持，换行策略与nl2br一致（hardbreaks）
+                html_content = self._cmark.github_flavored_markdown_to_html(
+                    body, options=self._cmark.cmark.Options.CMARK_OPT_HARDBREAKS
+                )
+            elif self._mistune is not None:
+                html_content = self._mistune(body)
+            else:
+                # 复用线程本地的解析器，reset()清理上一篇的状态
+                html_content = self._get_md().reset().convert(body)
             
             # 确保代码块有正确的CSS类
-            html_content = re.sub(
-                r'<pre><code(?!\s*class=)',
-                '<pre><code class="language-plaintext"',
-                html_content
+            html_content = _CODE_CLASS_RE.sub(
+                '<pre><code class="language-plaintext"', html_content
             )
             
             # 调试转换结果
@@ -160,7 +475,16 @@ class VaLogGenerator:
                         para_html = para.replace('\n', '<br>\n')
                         paragraphs.append(f'<p>{para_html}</p>')
                 html_content = '\n\n'.join(paragraphs)
-            
+
+            # 写入memo和磁盘缓存（失败不影响本次结果）
+            if len(self._md_memo) < 4096:
+                self._md_memo[cache_key] = html_content
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                _write_bytes(cache_path, html_content.encode("utf-8"))
+            except Exception as e:
+                print(f"Markdown缓存写入失败: {e}")
+
             return html_content
         except Exception as e:
             print(f"Markdown转换错误: {e}")
@@ -178,39 +502,283 @@ class VaLogGenerator:
             
             return '\n\n'.join(paragraphs) if paragraphs else ""
 
+    def fetch_issues_graphql(self, repo, token):
+        """通过GraphQL接口取回Issues，映射成REST风格的dict供后续流程使用
+
+        每次往返带回100条（编号/标题/正文/时间/标签一并取回），按
+        pageInfo游标翻页；失败时返回None由调用方回退到REST。
+        """
+        if not self.owner or not self.repo_name:
+            return None
+        query = """
+        query($owner: String!, $name: String!, $cursor: String) {
+          repository(owner: $owner, name: $name) {
+            issues(first: 100, states: OPEN,
+                   orderBy: {field: CREATED_AT, direction: DESC},
+                   after: $cursor) {
+              pageInfo { hasNextPage endCursor }
+              nodes {
+                number title body createdAt updatedAt
+                labels(first: 20) { nodes { name } }
+              }
+            }
+          }
+        }"""
+        issues = []
+        cursor = None
+        try:
+            while True:
+                resp = self.session.post(
+                    "https://api.github.com/graphql",
+                    json={"query": query,
+                          "variables": {"owner": self.owner, "name": self.repo_name, "cursor": cursor}},
+                    headers={"Authorization": f"bearer {token}"},
+                    timeout=30,
+                )
+                resp.raise_for_status()
+                payload = resp.json()
+                if payload.get("errors"):
+                    print(f"GraphQL查询出错: {payload['errors']}")
+                    return None
+                conn = payload["data"]["repository"]["issues"]
+                for node in conn["nodes"]:
+                    # 映射成REST字段名，process流程无需感知数据来源
+                    issues.append({
+                        "number": node["number"],
+                        "title": node["title"],
+                        "body": node["body"],
+                        "created_at": node["createdAt"],
+                        "updated_at": node["updatedAt"],
+                        "labels": node["labels"]["nodes"],
+                    })
+                if not conn["pageInfo"]["hasNextPage"]:
+                    return issues
+                cursor = conn["pageInfo"]["endCursor"]
+        except Exception as e:
+            print(f"GraphQL请求失败: {e}")
+            return None
+
+    def _check_rate_limit(self, response):
+        """剩余配额过低时短暂等待到重置时间，避免翻页中途被限流"""
+        try:
+            remaining = int(response.headers.get("X-RateLimit-Remaining", "1"))
+            if remaining < 10:
+                reset = int(response.headers.get("X-RateLimit-Reset", "0"))
+                wait = reset - time.time()
+                if 0 < wait <= 60:
+                    print(f"接近API限额，等待 {int(wait) + 1} 秒...")
+                    time.sleep(wait + 1)
+                elif wait > 60:
+                    print(f"警告: 接近API限额，距重置还有 {int(wait)} 秒")
+        except (TypeError, ValueError):
+            pass
+
+    def _http_get(self, url, headers, timeout=30):
+        """GET封装：httpx路径在这里补上429/5xx的退避重试
+
+        requests路径的状态码重试由挂载的HTTPAdapter(Retry)处理，
+        直接透传；httpx的transport重试只管连接故障，不看状态码。
+        """
+        if not self._status_retry:
+            return self.session.get(url, headers=headers, timeout=timeout)
+        response = None
+        for attempt in range(3):
+            response = self.session.get(url, headers=headers, timeout=timeout)
+            if response.status_code not in (429, 500, 502, 503, 504):
+                break
+            delay = 2 ** attempt
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    delay = max(delay, int(retry_after))
+                except ValueError:
+                    pass
+            print(f"请求返回 {response.status_code}，{delay} 秒后重试 ({attempt + 1}/3)...")
+            time.sleep(delay)
+        return response
+
+    def render_article_pages(self, pending_articles, blog_cfg, theme_cfg):
+        """并行渲染文章页面并写入磁盘（渲染+写文件均为独立任务，线程池重叠IO）
+
+        返回渲染/写盘失败的文章id集合，调用方据此作废对应缓存条目，
+        下次构建会重试这些文章
+        """
+        if not pending_articles:
+            print("没有需要更新的文章页面")
+            return set()
+
+        # 模板在__init__中已编译，所有线程共享（Jinja2模板渲染是线程安全的）
+        tmpl = self.article_tmpl
+
+        blog_context = {**blog_cfg, "theme": theme_cfg}
+
+        def _render_one(item):
+            article_data, body, md_body = item
+            iid = article_data["id"]
+            # Markdown转换放进任务里：只有需要更新的文章才会走到这里
+            article_data["content"] = self.process_body(md_body)
+            if tmpl is not None:
+                article_html = tmpl.render(article=article_data, blog=blog_context)
+            else:
+                # 使用简单模板作为备选
+                article_html = f"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>{article_data['title']}</title>
+    <style>
+        .content {{
+            white-space: pre-wrap;
+            word-wrap: break-word;
+            line-height: 1.8;
+        }}
+        .content p {{
+            margin-bottom: 1.5em;
+        }}
+    </style>
+</head>
+<body>
+    <h1>{article_data['title']}</h1>
+    <p>日期: {article_data['date']}</p>
+    <p>标签: {', '.join(article_data['tags'])}</p>
+    <div class="content">{article_data['content']}</div>
+</body>
+</html>"""
+
+            # 保存文章HTML（内容未变时跳过写盘）
+            article_path = f"{ARTICLE_PATH_PREFIX}{iid}.html"
+            if self._write_if_changed(article_path, article_html):
+                print(f"  已生成: {article_path}")
+            else:
+                print(f"  页面未变化，跳过: {article_path}")
+
+            # 备份原始Markdown（包含元数据），同样只在内容变化时写盘
+            md_path = f"{OMD_PATH_PREFIX}{iid}.md"
+            if self._write_if_changed(md_path, body):
+                print(f"  已备份: {md_path}")
+            else:
+                print(f"  备份未变化，跳过: {md_path}")
+
+        failed_ids = set()
+        failed_lock = threading.Lock()
+
+        def _render_and_write(item):
+            # 单篇失败只记录日志，不让异常穿出线程池打断整站发布
+            # （与主循环里逐篇try/except ... continue的策略一致）；
+            # 失败的id上报给调用方，避免缓存记住从未写成功的页面
+            try:
+                _render_one(item)
+            except Exception as e:
+                print(f"  渲染文章 #{item[0].get('id')} 失败: {e}")
+                import traceback
+                traceback.print_exc()
+                with failed_lock:
+                    failed_ids.add(item[0].get('id'))
+
+        max_workers = min(32, (os.cpu_count() or 4) * 4)
+        print(f"开始并行渲染 {len(pending_articles)} 篇文章 (workers={max_workers})...")
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            list(ex.map(_render_and_write, pending_articles))
+        return failed_ids
+
     def run(self):
         print("开始运行生成器...")
         
-        # 获取环境变量
-        repo = os.getenv("REPO")
-        token = os.getenv("GITHUB_TOKEN")
-        
+        # 环境变量已在__init__中解析
+        repo = self.repo
+        token = self.token
+
         if not repo:
             print("错误: REPO环境变量未设置")
             return
-        
+
         if not token:
             print("错误: GITHUB_TOKEN环境变量未设置")
             return
-        
+
         print(f"GitHub仓库: {repo}")
         print(f"Token长度: {len(token)}")
         
         # 设置请求头
         headers = {
             "Authorization": f"token {token}",
-            "Accept": "application/vnd.github.v3+json"
+            "Accept": "application/vnd.github.v3+json",
+            "User-Agent": "VaLog"
         }
         
-        # 获取GitHub Issues
+        # 获取GitHub Issues（条件请求：内容未变时GitHub直接返回304，
+        # 不传输正文也不消耗核心限额）
         print("获取GitHub Issues...")
+        new_etag = self._etag
         try:
-            url = f"https://api.github.com/repos/{repo}/issues?state=open&per_page=100"
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            issues = response.json()
+            issues = None
+            if self.config.get('use_graphql'):
+                # GraphQL一次往返带回100条（含标签），配额独立于REST
+                issues = self.fetch_issues_graphql(repo, token)
+                if issues is None:
+                    print("GraphQL获取失败，回退到REST接口")
+            if issues is None:
+                url = f"https://api.github.com/repos/{repo}/issues?state=open&per_page=100"
+                req_headers = dict(headers)
+                if self._etag and os.path.exists(ISSUES_CACHE):
+                    req_headers["If-None-Match"] = self._etag
+                response = self._http_get(url, headers=req_headers)
+                if response.status_code == 304:
+                    # 304只证明第1页未变；缓存读取失败（损坏/被外部截断）
+                    # 或缓存是多页结果（第2页以后的编辑不会动第1页的ETag）
+                    # 时都不可信，丢弃ETag改为全量获取
+                    cached_issues = None
+                    try:
+                        with open(ISSUES_CACHE, 'r', encoding='utf-8') as f:
+                            cached_issues = json.load(f)
+                    except Exception as e:
+                        print(f"Issues缓存读取失败，改为全量获取: {e}")
+                    if cached_issues is not None and len(cached_issues) < 100:
+                        print("Issues未变化(304)，使用本地缓存")
+                        issues = cached_issues
+                    else:
+                        if cached_issues is not None:
+                            print("缓存为多页结果，ETag不足以判定未变化，全量获取")
+                        new_etag = None
+                        response = self._http_get(url, headers=headers)
+                if issues is None:
+                    response.raise_for_status()
+                    issues = response.json()
+                    new_etag = response.headers.get("ETag")
+                    # 跟随Link头翻页：超过100个issue时不再被截断。
+                    # 能从rel="last"拿到总页数时，2..N页并发抓取，
+                    # 顺序翻页的 页数x往返延迟 变成一轮并发请求
+                    next_url = response.links.get('next', {}).get('url')
+                    last_url = response.links.get('last', {}).get('url')
+                    last_match = re.search(r'[?&]page=(\d+)', last_url) if last_url else None
+                    if last_match:
+                        last_page = int(last_match.group(1))
+                        self._check_rate_limit(response)
+
+                        def _fetch_page(p):
+                            r = self._http_get(f"{url}&page={p}", headers=headers)
+                            r.raise_for_status()
+                            return r.json()
+
+                        with ThreadPoolExecutor(max_workers=min(8, last_page - 1)) as ex:
+                            for page_items in ex.map(_fetch_page, range(2, last_page + 1)):
+                                issues.extend(page_items)
+                    else:
+                        while next_url:
+                            self._check_rate_limit(response)
+                            response = self._http_get(next_url, headers=headers)
+                            response.raise_for_status()
+                            issues.extend(response.json())
+                            next_url = response.links.get('next', {}).get('url')
+                    if last_match or len(issues) >= 100:
+                        # ETag只覆盖第1页，多页结果不能用它做整体条件请求
+                        new_etag = None
+                    try:
+                        self._write_if_changed(ISSUES_CACHE, _dumps(issues))
+                    except Exception as e:
+                        print(f"Issues缓存写入失败: {e}")
             print(f"获取到 {len(issues)} 个issue")
-        except requests.exceptions.RequestException as e:
+        except self._http_errors as e:
             print(f"GitHub API请求失败: {e}")
             return
         except Exception as e:
@@ -224,6 +792,7 @@ class VaLogGenerator:
         all_articles = []
         specials = []
         new_cache = {}
+        pending_articles = []  # 待渲染/写盘的文章 (article_data, 原始body)
 
         blog_cfg = self.config.get('blog', {})
         theme_cfg = self.config.get('theme', {})
@@ -236,89 +805,69 @@ class VaLogGenerator:
         print("开始处理文章...")
         for i, issue in enumerate(issues, 1):
             try:
+                # 先把本轮要多次访问的字段取成局部变量，减少重复的dict查找
                 iid = str(issue['number'])
                 updated_at = issue['updated_at']
+                title = issue['title']
+                created_at = issue.get('created_at')
+                date = created_at[:10] if created_at else ""
                 body = issue.get('body', '') or ''
-                tags = [label['name'] for label in issue.get('labels', [])]
-                
-                print(f"\n处理文章 {i}/{len(issues)}: #{iid} - {issue['title']}")
+                # labels可能为null（GraphQL映射/异常数据），用or兜底
+                tags = [label['name'] for label in issue.get('labels') or []]
+
+                print(f"\n处理文章 {i}/{len(issues)}: #{iid} - {title}")
                 print(f"  标签: {tags}")
                 
-                # 提取元数据和正文（这里会分离元数据和正文）
-                metadata = self.extract_metadata_and_body(body)
-                
-                # 垂直标题优先级：元数据中的垂直标题 > 文章标题 > "Blog"
-                vertical_title = metadata["vertical_title"] or issue['title'] or "ABlog"
-                
-                # 检查是否需要更新
-                need_update = iid not in self.cache or self.cache[iid] != updated_at
-                
-                # 处理正文内容
-                processed_content = self.process_body(metadata["body"])
-                
+                # 检查是否需要更新：以渲染输入（标题+标签+正文）的内容哈希
+                # 为准，updated_at只作参考记录——加标签、关闭重开等只动时间
+                # 戳的事件不再触发重渲；另外要求页面产物还在（防止docs被
+                # 清理后缓存仍然命中）
+                hasher = hashlib.blake2b(digest_size=16)
+                hasher.update(title.encode('utf-8'))
+                hasher.update(b'\x00')
+                hasher.update(','.join(sorted(tags)).encode('utf-8'))
+                hasher.update(b'\x00')
+                hasher.update(body.encode('utf-8'))
+                content_sha = hasher.hexdigest()
+                cached = self.cache.get(iid)
+                if isinstance(cached, dict):
+                    cache_hit = cached.get("content_sha") == content_sha
+                else:
+                    cache_hit = cached == updated_at  # 兼容旧的纯时间戳格式
+                need_update = (not cache_hit
+                               or self._template_changed
+                               or not os.path.exists(f"{ARTICLE_PATH_PREFIX}{iid}.html"))
+
+                # 命中缓存且条目里存有提取结果时，元数据提取整个跳过；
+                # 旧格式条目缺这两个字段，走正常提取并在下面补全
+                if not need_update and isinstance(cached, dict) and "summary" in cached:
+                    summary = cached["summary"]
+                    vertical_title = cached.get("vertical_title") or title or "ABlog"
+                    md_body = None  # 不需要渲染，正文也就不需要了
+                else:
+                    metadata = self.extract_metadata_and_body(body)
+                    summary = metadata["summary"]
+                    # 垂直标题优先级：元数据中的垂直标题 > 文章标题 > "Blog"
+                    vertical_title = metadata["vertical_title"] or title or "ABlog"
+                    md_body = metadata["body"]
+
                 article_data = {
                     "id": iid,
-                    "title": issue['title'],
-                    "date": issue['created_at'][:10] if issue.get('created_at') else "",
+                    "title": title,
+                    "date": date,
                     "tags": tags,
-                    "content": processed_content,  # 使用处理后的HTML内容
-                    "raw_content": metadata["body"],  # 保留原始内容用于调试
+                    "content": "",  # HTML内容仅在需要更新时由渲染任务填充
                     "url": f"article/{iid}.html",
                     "verticalTitle": vertical_title,
-                    "summary": metadata["summary"]
+                    "summary": summary
                 }
-                
+
                 if need_update:
                     print(f"  需要更新: {need_update}")
-                    
-                    # 获取文章模板
-                    try:
-                        tmpl = self.env.get_template(self.article_template_name)
-                    except Exception as e:
-                        print(f"  模板加载失败: {e}")
-                        # 使用简单模板作为备选
-                        article_html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>{article_data['title']}</title>
-    <style>
-        .content {{
-            white-space: pre-wrap;
-            word-wrap: break-word;
-            line-height: 1.8;
-        }}
-        .content p {{
-            margin-bottom: 1.5em;
-        }}
-    </style>
-</head>
-<body>
-    <h1>{article_data['title']}</h1>
-    <p>日期: {article_data['date']}</p>
-    <p>标签: {', '.join(article_data['tags'])}</p>
-    <div class="content">{processed_content}</div>
-</body>
-</html>"""
-                    else:
-                        # 渲染文章页面
-                        article_html = tmpl.render(
-                            article=article_data, 
-                            blog={**blog_cfg, "theme": theme_cfg}
-                        )
-                    
-                    # 保存文章HTML
-                    article_path = os.path.join(ARTICLE_DIR, f"{iid}.html")
-                    with open(article_path, "w", encoding="utf-8") as f:
-                        f.write(article_html)
-                    print(f"  已生成: {article_path}")
-                    
-                    # 备份原始Markdown（包含元数据）
-                    md_path = os.path.join(OMD_DIR, f"{iid}.md")
-                    with open(md_path, "w", encoding="utf-8") as f:
-                        f.write(body)
-                    print(f"  已备份: {md_path}")
-                
+                    # Markdown转换、模板渲染和写文件都是独立的逐篇任务，
+                    # 统一收集后在线程池里并行处理；未变化的文章完全跳过转换
+                    pending_articles.append((article_data, body, md_body))
+
                 # 检查是否为特殊文章
                 is_special = False
 
@@ -341,10 +890,10 @@ class VaLogGenerator:
                 # 对于文章列表，使用摘要
                 list_article_data = {
                     "id": iid,
-                    "title": issue['title'],
-                    "date": issue['created_at'][:10] if issue.get('created_at') else "",
+                    "title": title,
+                    "date": date,
                     "tags": tags,
-                    "content": metadata["summary"],  # 列表使用摘要
+                    "content": summary,  # 列表使用摘要
                     "url": f"article/{iid}.html",
                     "verticalTitle": vertical_title
                 }
@@ -357,7 +906,12 @@ class VaLogGenerator:
                     all_articles.append(list_article_data)
                 
                 # 更新缓存
-                new_cache[iid] = updated_at
+                new_cache[iid] = {
+                    "updated_at": updated_at,
+                    "content_sha": content_sha,
+                    "summary": summary,
+                    "vertical_title": vertical_title,
+                }
                     
             except Exception as e:
                 print(f"  处理文章时出错: {e}")
@@ -365,15 +919,31 @@ class VaLogGenerator:
                 traceback.print_exc()
                 continue
         
+        # 并行渲染并写出需要更新的文章页面；失败的文章从新缓存中剔除，
+        # 否则内容哈希已经记上，瞬时故障会把过期页面永久钉在磁盘上
+        failed_ids = self.render_article_pages(pending_articles, blog_cfg, theme_cfg)
+        for fid in failed_ids:
+            if new_cache.pop(fid, None) is not None:
+                print(f"文章 #{fid} 渲染失败，缓存条目已作废，下次构建重试")
+
         print(f"\n普通文章: {len(all_articles)} 篇")
         print(f"特殊文章: {len(specials)} 篇")
         print(f"文章处理完成，总计: {len(all_articles) + len(specials)} 篇")
         
-        # 保存缓存
+        # 保存缓存（附带本次的ETag，供下次条件请求使用）。文章条目与
+        # 保留键都未变时，dict相等比较远比重新编码JSON便宜，直接跳过
         try:
-            with open(OMD_JSON, 'w', encoding='utf-8') as f:
-                json.dump(new_cache, f, indent=2, ensure_ascii=False)
-            print(f"缓存已保存: {OMD_JSON}")
+            if (new_cache == self.cache
+                    and new_etag == self._etag
+                    and self._template_sha == self._prev_template_sha
+                    and os.path.exists(OMD_JSON)):
+                print("缓存未变化，跳过保存")
+            else:
+                if new_etag:
+                    new_cache["_etag"] = new_etag
+                new_cache["_template_sha"] = self._template_sha
+                self._write_if_changed(OMD_JSON, _dumps_pretty(new_cache))
+                print(f"缓存已保存: {OMD_JSON}")
         except Exception as e:
             print(f"缓存保存失败: {e}")
         
@@ -408,39 +978,97 @@ class VaLogGenerator:
             specials.append(default_special)
             print("已使用配置信息填充special数组")
         
-        # 生成 base.yaml
+        # 解析浮动菜单链接：先建 tag -> 文章URL 索引（首篇匹配优先），
+        # 再逐项查表，避免 菜单数 x 文章数 的嵌套扫描
+        floating_menu = self.config.get('floating_menu', []) or []
+        if floating_menu:
+            tag_to_url = {}
+            for a in all_articles + specials:
+                for t in a.get('tags', []):
+                    tag_to_url.setdefault(t, a['url'])
+            for item in floating_menu:
+                if isinstance(item, dict) and item.get('tag'):
+                    item['url'] = tag_to_url.get(item['tag'], '#')
+
+        # 生成站点数据产物：base.json始终输出（orjson紧凑格式，序列化
+        # 成本极低，下游工具消费也更方便）；base.yaml是兼容产物，
+        # 可配置 emit_base_yaml: false 跳过这步慢得多的序列化
+        base_data = {
+            "blog": {**blog_cfg, "theme": theme_cfg},
+            "articles": all_articles,
+            "specials": specials,
+            "floating_menu": self.config.get('floating_menu', []),
+            "special_config": special_cfg
+        }
+        base_changed = True
         try:
-            base_data = {
-                "blog": {**blog_cfg, "theme": theme_cfg}, 
-                "articles": all_articles, 
-                "specials": specials, 
-                "floating_menu": self.config.get('floating_menu', []),
-                "special_config": special_cfg
-            }
-            with open(BASE_YAML_OUT, 'w', encoding='utf-8') as f:
-                yaml.dump(base_data, f, allow_unicode=True, sort_keys=False)
-            print(f"base.yaml 已生成: {BASE_YAML_OUT}")
+            base_changed = self._write_if_changed(BASE_JSON_OUT, _dumps(base_data))
+            print(f"base.json 已生成: {BASE_JSON_OUT}")
         except Exception as e:
-            print(f"base.yaml 生成失败: {e}")
+            print(f"base.json 生成失败: {e}")
+        if self.config.get('emit_base_yaml', True):
+            # base.json的字节未变即意味着base_data内容未变——用它当
+            # 脏标记，跳过慢得多的YAML序列化
+            if not base_changed and os.path.exists(BASE_YAML_OUT):
+                print("base_data未变化，跳过 base.yaml 序列化")
+            else:
+                try:
+                    self._write_if_changed(
+                        BASE_YAML_OUT,
+                        yaml.dump(base_data, Dumper=_YamlDumper, allow_unicode=True, sort_keys=False)
+                    )
+                    print(f"base.yaml 已生成: {BASE_YAML_OUT}")
+                except Exception as e:
+                    print(f"base.yaml 生成失败: {e}")
+        else:
+            print("已按配置跳过 base.yaml 生成")
+        del base_data  # 序列化完成即释放，首页生成直接用原始列表
         
+        # 同步静态资源
+        self.copy_static_resources()
+
         # 生成首页
         self.generate_index(all_articles, specials)
         
+        # 直接用写盘计数做收尾汇总，不再递归遍历docs目录数文件
+        print(f"写盘统计: {self._files_written} 个文件更新, {self._files_skipped} 个未变化")
+        if self.blog_url:
+            print(f"博客地址: {self.blog_url}")
         print("\n生成器运行完成！")
 
+    def copy_static_resources(self):
+        """将static目录同步到docs下（不删除重建，未变化的资源零拷贝）"""
+        static_src = os.path.join(BASE_DIR, "static")
+        if not os.path.isdir(static_src):
+            return
+        static_dst = os.path.join(DOCS_DIR, "static")
+        try:
+            shutil.copytree(static_src, static_dst, dirs_exist_ok=True, copy_function=_link_or_copy)
+            # 清理源中已删除的条目，使docs/static与static保持一致
+            for root, dirs, files in os.walk(static_dst, topdown=False):
+                rel = os.path.relpath(root, static_dst)
+                src_root = static_src if rel == '.' else os.path.join(static_src, rel)
+                for name in files:
+                    if not os.path.exists(os.path.join(src_root, name)):
+                        os.remove(os.path.join(root, name))
+                for name in dirs:
+                    if not os.path.exists(os.path.join(src_root, name)):
+                        shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+            print(f"静态资源已同步: {static_dst}")
+        except Exception as e:
+            print(f"静态资源同步失败: {e}")
+
     def generate_index(self, articles, specials):
         print("生成首页...")
         
-        # 使用配置的首页模板文件名
-        home_tmpl_path = os.path.join(TEMPLATE_DIR, self.home_template_name)
-        if not os.path.exists(home_tmpl_path):
-            print(f"错误: 首页模板不存在: {home_tmpl_path}")
+        # 首页模板在__init__中已编译
+        if self.home_tmpl is None:
+            print(f"错误: 首页模板不可用: {self.home_template_name}")
             return
-        
+
         try:
-            # 使用配置的首页模板文件名
-            tmpl = self.env.get_template(self.home_template_name)
-            
+            tmpl = self.home_tmpl
+
             context = {
                 "BLOG_NAME": self.config.get('blog', {}).get('name', 'VaLog'),
                 "SPECIAL_NAME": self.config.get('blog', {}).get('sname', 'Special'),
@@ -450,18 +1078,41 @@ class VaLogGenerator:
                 "THEME_MODE": self.config.get('theme', {}).get('mode', 'dark'),
                 "PRIMARY_COLOR": self.config.get('theme', {}).get('primary_color', '#e74c3c'),
                 "TOTAL_TIME": self.config.get('special', {}).get('view', {}).get('Total_time', '2023.01.01'),
-                "ARTICLES_JSON": json.dumps(articles, ensure_ascii=False),
-                "SPECIALS_JSON": json.dumps(specials, ensure_ascii=False),
-                "MENU_ITEMS_JSON": json.dumps(self.config.get('floating_menu', []), ensure_ascii=False),
+                # 嵌入页面的JSON用紧凑格式：编码走C加速路径，产物也更小
+                "ARTICLES_JSON": _dumps(articles),
+                "SPECIALS_JSON": _dumps(specials),
+                "MENU_ITEMS_JSON": _dumps(self.config.get('floating_menu', [])),
                 "SPECIAL_TAGS": self.config.get('special_tags', ''),
             }
             
-            rendered = tmpl.render(**context)
-            
+            # 渲染输入（全部是字符串）+模板哈希未变且产物还在时，
+            # 连模板渲染都省掉——“无更新”构建的常见情况
+            hasher = hashlib.blake2b(digest_size=16)
+            for value in context.values():
+                hasher.update(str(value).encode('utf-8'))
+                hasher.update(b'\x00')
+            hasher.update(self._home_template_sha.encode('utf-8'))
+            context_hash = hasher.hexdigest()
             index_path = os.path.join(DOCS_DIR, "index.html")
-            with open(index_path, "w", encoding="utf-8") as f:
-                f.write(rendered)
-            
+            prev_hash = None
+            try:
+                with open(INDEX_HASH_CACHE, 'r', encoding='utf-8') as f:
+                    prev_hash = f.read().strip()
+            except OSError:
+                pass
+            if prev_hash == context_hash and os.path.exists(index_path):
+                print("首页输入未变化，跳过渲染")
+                return
+
+            rendered = tmpl.render(**context)
+
+            self._write_if_changed(index_path, rendered)
+            try:
+                with open(INDEX_HASH_CACHE, 'w', encoding='utf-8') as f:
+                    f.write(context_hash)
+            except OSError:
+                pass
+
             print(f"首页已生成: {index_path}")
             print(f"首页大小: {len(rendered)} 字节")
             
@@ -471,10 +1122,18 @@ class VaLogGenerator:
             traceback.print_exc()
 
 def main():
+    # --clean: 清空本地缓存目录后重新全量构建
+    if "--clean" in sys.argv[1:]:
+        cache_root = os.path.join(BASE_DIR, ".valog-cache")
+        shutil.rmtree(cache_root, ignore_errors=True)
+        os.makedirs(MD_CACHE_DIR, exist_ok=True)
+        os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+        print(f"缓存已清空: {cache_root}")
+
     print("=" * 50)
     print("VaLog Generator 启动")
     print(f"工作目录: {os.getcwd()}")
-    print(f"Python版本: {os.sys.version}")
+    print(f"Python版本: {sys.version}")
     print("=" * 50)
     
     try: